@@ -0,0 +1,412 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import polars as pl
+import os
+import io
+import glob
+import hashlib
+import pickle
+import plotly.io as pio
+
+# Serialize every figure (st.plotly_chart -> pio.to_json) with orjson, not stdlib json
+pio.json.config.default_engine = 'orjson'
+
+# --- DYNAMIC PATH HANDLING ---
+# This locates the folder where the app files are sitting on the server
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+def get_file_path(filename):
+    return os.path.join(current_dir, filename)
+
+DATA_FILES = ['revenue_forecast_scenarios.csv', 'roi_simulation_results.csv', 'segment_decision_summary.csv']
+# One cache directory per checkout, so deployments sharing a HOME never prune each other
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'dib',
+                         hashlib.sha1(current_dir.encode()).hexdigest()[:12])
+
+# --- DATA LOADING ---
+def read_table(filename, date_cols=()):
+    # Parse the CSV once and keep a Parquet copy next to it for later cold starts.
+    # The copy is rebuilt whenever the CSV is newer than it.
+    csv_path = get_file_path(filename)
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        try:
+            return pd.read_parquet(parquet_path)
+        except Exception:
+            # Truncated or unreadable copy; drop it and parse the CSV again
+            try:
+                os.remove(parquet_path)
+            except OSError:
+                pass
+
+    df = (
+        pl.scan_csv(csv_path)
+        .with_columns([pl.col(c).str.to_datetime(format='%d-%m-%Y', strict=False) for c in date_cols])
+        .collect()
+        .to_pandas()
+    )
+    # Write under a per-process name and swap it in, so readers never see a partial file
+    tmp_path = f'{parquet_path}.{os.getpid()}.tmp'
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+        os.replace(tmp_path, parquet_path)
+    except OSError:
+        # Read-only deployments simply keep parsing the CSV
+        pass
+    finally:
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return df
+
+def downcast_numeric(df, int_cols=(), float_cols=()):
+    # Shrink the given columns to the smallest dtype that holds the values; smaller
+    # arrays make pandas ops and Plotly serialization cheaper. The float downcast
+    # tolerates some rounding, so only pass columns that are never shown to the cent.
+    for c in int_cols:
+        df[c] = pd.to_numeric(df[c], downcast='integer')
+    for c in float_cols:
+        df[c] = pd.to_numeric(df[c], downcast='float')
+    return df
+
+def parse_data():
+    forecast_df = read_table('revenue_forecast_scenarios.csv', date_cols=['Date'])
+    # ROI columns feed the currency/ratio metrics and stay at full precision
+    roi_df = read_table('roi_simulation_results.csv')
+    segment_df = downcast_numeric(read_table('segment_decision_summary.csv'),
+                                  int_cols=['Customer_Count', 'Cluster'],
+                                  float_cols=['Avg_Recency', 'Avg_Frequency'])
+
+    # Derived ROI columns, computed once in a single vectorized pass
+    gain = roi_df['Projected_Gain'].values
+    investment = roi_df['Investment'].values
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi_df = roi_df.assign(
+            Profit_Multiplier=np.where(investment > 0, gain / investment, np.nan),
+            BreakEven_Met=gain > roi_df['BreakEven_Revenue'].values,
+        )
+
+    # Arrow-backed columns keep the downcast widths (float32 -> float[pyarrow]),
+    # which Plotly encodes as packed typed arrays instead of JSON number lists
+    roi_df = roi_df.convert_dtypes(dtype_backend='pyarrow')
+    segment_df = segment_df.convert_dtypes(dtype_backend='pyarrow')
+
+    # Executive Summary KPIs only depend on the static data, so compute them once here
+    kpis = {
+        'total_customers': int(segment_df['Customer_Count'].sum()),
+        'total_gain': float(roi_df['Projected_Gain'].sum()),
+        'avg_roi': float(roi_df['ROI'].mean()),
+        'total_inv': float(roi_df['Investment'].sum()),
+    }
+
+    # Sorted view for the ROI bar chart and a Segment index for O(1) lookups
+    roi_sorted = roi_df.sort_values('ROI', ascending=False)
+    roi_by_segment = roi_df.set_index('Segment')
+    return forecast_df, roi_df, segment_df, kpis, roi_sorted, roi_by_segment
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_data():
+    # st.cache_data only lives as long as the process, so keep a pickle on disk
+    # that every worker can reuse. The key changes whenever a CSV or this module does.
+    sources = [get_file_path(f) for f in DATA_FILES] + [os.path.abspath(__file__)]
+    key = hashlib.sha1(repr([(p, os.path.getmtime(p)) for p in sources]).encode()).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f'{key}.pkl')
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # Truncated or unreadable (e.g. written by another pandas/pyarrow);
+            # drop it and rebuild from the source files
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+
+    data = parse_data()
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+
+        # Older keys can never be hit again, so only the current pickle is kept
+        for old_path in glob.glob(os.path.join(CACHE_DIR, '*.pkl')):
+            if old_path != cache_path:
+                os.remove(old_path)
+    except OSError:
+        pass
+    finally:
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return data
+
+@st.cache_resource
+def load_logo():
+    # Decode and shrink the logo to its 160px display width once; every rerun
+    # reuses the small JPEG bytes (the logo is photo-like, PNG would be ~4x larger)
+    from PIL import Image
+    img = Image.open(get_file_path('Mu_sigma_logo.jpg'))
+    img.thumbnail((160, img.height), Image.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, format='JPEG', quality=85, optimize=True, progressive=True)
+    return buf.getvalue()
+
+# Above this many points per line the forecast is downsampled before plotting
+MAX_CHART_POINTS = 2000
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int = MAX_CHART_POINTS) -> tuple[np.ndarray, np.ndarray]:
+    # Largest-Triangle-Three-Buckets: keep the first and last points, split the rest
+    # into n_out - 2 buckets and from each keep the point forming the largest triangle
+    # with the previously kept point and the average of the next bucket
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    # Area maths runs on floats; datetimes are compared as nanoseconds
+    if np.issubdtype(x.dtype, np.datetime64):
+        xf = x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    else:
+        xf = x.astype(np.float64)
+    yf = y.astype(np.float64)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = xf[end:next_end].mean()
+        avg_y = yf[end:next_end].mean()
+        area = np.abs((xf[a] - avg_x) * (yf[start:end] - yf[a])
+                      - (xf[a] - xf[start:end]) * (avg_y - yf[a]))
+        a = start + int(area.argmax())
+        idx[i + 1] = a
+    return x[idx], y[idx]
+
+# --- CHART BUILDERS ---
+# Figures are pure functions of the static data, so reruns reuse the cached copy.
+# Plotly is imported inside each builder so only the charts being drawn pay for it.
+@st.cache_data
+def build_action_pie(segment_df):
+    import plotly.express as px
+    return px.pie(segment_df, values='Customer_Count', names='Decision_Action', 
+                  title="Customers by Strategic Action", hole=0.4,
+                  color_discrete_sequence=px.colors.qualitative.Safe)
+
+@st.cache_data
+def build_roi_efficiency_bar(roi_sorted):
+    import plotly.express as px
+    return px.bar(roi_sorted, x='Segment', y='ROI', 
+                  title="ROI Efficiency per Segment", color='ROI', 
+                  color_continuous_scale='GnBu')
+
+@st.cache_data
+def build_rfm_scatter(segment_df):
+    import plotly.express as px
+    return px.scatter(segment_df, x='Avg_Recency', y='Avg_Frequency', 
+                      size='Customer_Count', color='Decision_Action',
+                      hover_name='Decision_Action', text='Cluster', render_mode='webgl')
+
+@st.cache_data
+def build_monetary_bar(segment_df):
+    import plotly.express as px
+    return px.bar(segment_df, x='Cluster', y='Avg_Monetary', color='Decision_Action')
+
+@st.cache_data
+def build_forecast_chart(forecast_df, scenarios):
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    # One long-form px.line call draws every selected scenario
+    colors = {'Base_Forecast': '#1f77b4', 'Best_Case': '#2ca02c', 'Worst_Case': '#d62728'}
+    dates = forecast_df['Date'].values
+    if len(forecast_df) > MAX_CHART_POINTS and scenarios:
+        # Long ranges: send a downsampled copy of each line to the browser
+        parts = []
+        for scenario in scenarios:
+            x, y = lttb(dates, forecast_df[scenario].values)
+            parts.append(pd.DataFrame({'Date': x, 'Scenario': scenario, 'Revenue': y}))
+        long_df = pd.concat(parts, ignore_index=True)
+    else:
+        long_df = forecast_df.melt(id_vars='Date', value_vars=list(scenarios), 
+                                   var_name='Scenario', value_name='Revenue')
+    fig_forecast = px.line(long_df, x='Date', y='Revenue', color='Scenario', 
+                           color_discrete_map=colors, render_mode='webgl')
+    fig_forecast.update_traces(line_width=3)
+
+    # Add Shaded 95% Confidence Interval (upper edge forward, lower edge back)
+    x_upper, y_upper = lttb(dates, forecast_df['Upper_CI'].values)
+    x_lower, y_lower = lttb(dates, forecast_df['Lower_CI'].values)
+    x_band = np.concatenate([x_upper, x_lower[::-1]])
+    y_band = np.concatenate([y_upper, y_lower[::-1]])
+    fig_forecast.add_trace(go.Scattergl(
+        x=x_band,
+        y=y_band,
+        fill='toself', fillcolor='rgba(100,100,100,0.1)', 
+        line_color='rgba(255,255,255,0)', name='95% Confidence Interval'
+    ))
+    # Keep the band underneath the scenario lines
+    fig_forecast.data = fig_forecast.data[-1:] + fig_forecast.data[:-1]
+
+    fig_forecast.update_layout(
+        title="6-Month Revenue Projection",
+        xaxis_title="Timeline", yaxis_title="Revenue ($)",
+        hovermode="x unified", template="plotly_white"
+    )
+    return fig_forecast
+
+@st.cache_data
+def build_investment_bar(roi_df):
+    import plotly.graph_objects as go
+    fig_roi_bar = go.Figure(data=[
+        go.Bar(name='Investment', x=roi_df['Segment'], y=roi_df['Investment'], marker_color='indianred'),
+        go.Bar(name='Projected Gain', x=roi_df['Segment'], y=roi_df['Projected_Gain'], marker_color='lightseagreen')
+    ])
+    fig_roi_bar.update_layout(barmode='group', template="plotly_white")
+    return fig_roi_bar
+
+# --- UI HEADER (Logo and Title Above Navigation) ---
+HEADER_HTML = """
+    <div style="padding-top: 10px;">
+        <h1 style='margin-bottom: 0px;'>Decision Intelligence Dashboard</h1>
+        <p style='font-size: 1.3rem; color: #666;'>Revenue Growth & Risk Management</p>
+    </div>
+"""
+
+def render_header():
+    header_col1, header_col2 = st.columns([1, 4])
+
+    with header_col1:
+        try:
+            st.image(load_logo(), width=160)
+        except Exception:
+            st.info("Logo Placeholder")
+
+    with header_col2:
+        st.markdown(HEADER_HTML, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+# Each page is a fragment: its own widgets (scenario picker, segment selectbox)
+# rerun only the page body, not the header, data load and sidebar.
+
+# --- PAGE 1: EXECUTIVE SUMMARY ---
+@st.fragment
+def render_executive_summary(segment_df, kpis, roi_sorted):
+    st.header("📊 Executive Summary")
+    
+    # Top Level KPI Metrics
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Total Customers", f"{kpis['total_customers']:,}")
+    m2.metric("Projected Gain", f"${kpis['total_gain']:,.0f}")
+    m3.metric("Avg ROI Multiplier", f"{kpis['avg_roi']:,.1f}x")
+    m4.metric("Total Investment", f"${kpis['total_inv']:,.0f}")
+
+    st.markdown("### Strategic Overview")
+    c1, c2 = st.columns(2)
+    with c1:
+        st.plotly_chart(build_action_pie(segment_df), use_container_width=True)
+    
+    with c2:
+        st.plotly_chart(build_roi_efficiency_bar(roi_sorted), use_container_width=True)
+
+# --- PAGE 2: CUSTOMER SEGMENTATION ---
+@st.fragment
+def render_customer_segmentation(segment_df):
+    st.header("👥 Customer Segmentation Analysis")
+    
+    st.subheader("Segment Performance Data")
+    # Native grid with an in-cell bar for Avg_Monetary (no pandas Styler / matplotlib)
+    st.dataframe(
+        segment_df, hide_index=True, use_container_width=True,
+        column_config={
+            'Avg_Monetary': st.column_config.ProgressColumn(
+                'Avg Monetary', format='$%.2f',
+                min_value=0, max_value=float(segment_df['Avg_Monetary'].max())
+            )
+        }
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("RFM: Recency vs Frequency")
+        st.plotly_chart(build_rfm_scatter(segment_df), use_container_width=True)
+    
+    with col2:
+        st.subheader("Monetary Value by Cluster")
+        st.plotly_chart(build_monetary_bar(segment_df), use_container_width=True)
+
+# --- PAGE 3: REVENUE FORECASTING ---
+@st.fragment
+def render_revenue_forecasting(forecast_df):
+    st.header("📈 Revenue Forecasting Scenarios")
+    
+    scenarios = st.multiselect("Select Scenarios to Compare:", 
+                               ['Base_Forecast', 'Best_Case', 'Worst_Case'], 
+                               default=['Base_Forecast'])
+
+    st.plotly_chart(build_forecast_chart(forecast_df, scenarios), use_container_width=True)
+    st.info("Shaded area represents the statistical variance of the Base Forecast.")
+
+# --- PAGE 4: ROI ANALYSIS ---
+@st.fragment
+def render_roi_analysis(roi_df, roi_by_segment):
+    st.header("💰 Investment & ROI Simulation")
+    
+    st.subheader("Investment Efficiency (Investment vs Gain)")
+    st.plotly_chart(build_investment_bar(roi_df), use_container_width=True)
+
+    st.markdown("---")
+    st.subheader("Segment Deep Dive")
+    sel_seg = st.selectbox("Select Segment for Detailed Metrics:", roi_df['Segment'].unique())
+    seg_data = roi_by_segment.loc[sel_seg]
+    
+    d1, d2, d3 = st.columns(3)
+    d1.metric("ROI Ratio", f"{seg_data['ROI']:.2f}x")
+    d2.metric("Break-Even Revenue", f"${seg_data['BreakEven_Revenue']:,.2f}")
+    # Missing when the segment has no investment (<NA> once Arrow-backed)
+    profit_mult = seg_data['Profit_Multiplier']
+    d3.metric("Profit Multiplier", "n/a" if pd.isna(profit_mult) else f"{profit_mult:.1f}x")
+
+    if not seg_data['BreakEven_Met']:
+        st.warning(f"Projected gain for {sel_seg} does not cover its break-even revenue.")
+
+def main():
+    # Set page configuration
+    st.set_page_config(
+        page_title="Decision Intelligence Dashboard", 
+        page_icon="📊",
+        layout="wide"
+    )
+
+    render_header()
+
+    # Global Data Load
+    try:
+        forecast_df, roi_df, segment_df, kpis, roi_sorted, roi_by_segment = load_data()
+    except Exception as e:
+        st.error(f"⚠️ Critical Error: Data files not found. Error details: {e}")
+        st.stop()
+
+    # --- SIDEBAR NAVIGATION ---
+    st.sidebar.header("Navigation")
+    page = st.sidebar.radio("Navigate to:", 
+        ["Executive Summary", "Customer Segmentation", "Revenue Forecasting", "ROI Analysis"])
+
+    if page == "Executive Summary":
+        render_executive_summary(segment_df, kpis, roi_sorted)
+    elif page == "Customer Segmentation":
+        render_customer_segmentation(segment_df)
+    elif page == "Revenue Forecasting":
+        render_revenue_forecasting(forecast_df)
+    elif page == "ROI Analysis":
+        render_roi_analysis(roi_df, roi_by_segment)